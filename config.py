@@ -14,3 +14,6 @@ YEARS = range(2015, 2026)
 # Max number of nearby stations to try
 MAX_NEARBY = 32
 
+# Where to cache NOAA responses for past years (set to None to disable)
+CACHE_DIR = "~/.cache/noaa"
+
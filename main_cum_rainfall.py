@@ -15,7 +15,8 @@ from __future__ import annotations
 import argparse
 import ast
 from datetime import datetime, date
-from typing import Iterable, List, Optional
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
 import sys
 
 import pandas as pd
@@ -30,15 +31,21 @@ def _get_cfg(name: str, default):
     return getattr(cfg, name, default)
 
 
-def _parse_years(spec: Optional[str], fallback: Iterable[int]) -> List[int]:
+def _parse_years(spec: Optional[str], fallback: Iterable[int]) -> Tuple[Sequence[int], int]:
     """
+    Parse a years spec and return (years, latest_year).
+
     Accepts:
       - Range:  '2018:2025'
       - CSV:    '2018,2019,2021'
       - List:   '[2018, 2020, 2024]'  (must be quoted in shell)
+
+    The range form stays a lazy `range` (no list materialization) and its
+    latest year is known from the endpoint without a max() scan.
     """
     if not spec:
-        return list(fallback)
+        years = list(fallback)
+        return years, max(years)
     s = spec.strip()
     if s.startswith("[") and s.endswith("]"):
         try:
@@ -46,7 +53,7 @@ def _parse_years(spec: Optional[str], fallback: Iterable[int]) -> List[int]:
             years = [int(x) for x in seq]
             if not years:
                 raise ValueError
-            return years
+            return years, max(years)
         except Exception:
             raise ValueError("Invalid list for --years; e.g., '[2022, 2025, 2027]'")
     if ":" in s:
@@ -54,8 +61,9 @@ def _parse_years(spec: Optional[str], fallback: Iterable[int]) -> List[int]:
         start, end = int(a), int(b)
         if end < start:
             raise ValueError("years range end must be >= start")
-        return list(range(start, end + 1))
-    return [int(x.strip()) for x in s.split(",") if x.strip()]
+        return range(start, end + 1), end
+    years = [int(x.strip()) for x in s.split(",") if x.strip()]
+    return years, max(years)
 
 
 def _parse_date(s: Optional[str]) -> Optional[date]:
@@ -75,6 +83,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("--end-date", help="Clip to this date (YYYY-MM-DD); default: today")
     parser.add_argument("--start-day", type=int, default=1,
                         help="Start plotting from this day-of-year (1..366). Default: 1 (Jan 1)")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read/write the past-year disk cache")
     parser.add_argument("--save", help="Save figure to this path (png/pdf/svg, etc.)")
     parser.add_argument("--no-show", action="store_true", help="Do not display the plot window")
     parser.add_argument("--verbose", action="store_true", help="Print additional diagnostics")
@@ -91,9 +100,11 @@ def main(argv: Optional[List[str]] = None) -> int:
     max_nearby = args.max_nearby if args.max_nearby is not None else _get_cfg("MAX_NEARBY", 12)
     units = args.units if args.units else _get_cfg("UNITS", "standard")
     years_cfg = _get_cfg("YEARS", range(2020, datetime.now().year + 1))
-    years = _parse_years(args.years, years_cfg)
+    years, latest_year = _parse_years(args.years, years_cfg)
     end_date = _parse_date(args.end_date)
-    latest_year = max(years)
+
+    cache_cfg = _get_cfg("CACHE_DIR", None)
+    cache_dir = None if (args.no_cache or not cache_cfg) else Path(cache_cfg).expanduser()
 
     # Choose station (command-line overrides auto-pick)
     if args.station:
@@ -122,13 +133,13 @@ def main(argv: Optional[List[str]] = None) -> int:
     end_for_label = end_date or date.today()
     end_doy = end_for_label.timetuple().tm_yday
     print(
-        f"Years: {years}  Units: {units}  "
+        f"Years: {list(years)}  Units: {units}  "
         f"Window: DOY {args.start_day}..{end_doy} (ends {end_for_label.isoformat()})"
     )
 
     # Fetch data
     try:
-        df = fetch_precip_for_years(token, station_id, years, units)
+        df = fetch_precip_for_years(token, station_id, years, units, cache_dir=cache_dir)
     except Exception as e:
         print("ERROR: Fetch failed. NOAA CDO may be rate-limiting or under maintenance.", file=sys.stderr)
         print(f"Details: {e}", file=sys.stderr)
@@ -140,7 +151,7 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     # Summary after fetch (always print concise summary)
     total_rows = len(df)
-    rows_by_year = df.groupby("year").size().to_dict()
+    rows_by_year = df.groupby("year", sort=False).size().to_dict()
     try:
         min_d = df["date"].min().date()
         max_d = df["date"].max().date()
@@ -149,7 +160,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     print(f"Fetched {total_rows} rows | rows by year: {rows_by_year} | date range: {min_d} .. {max_d}")
 
     if args.verbose:
-        doy_counts = df.groupby("year")["doy"].nunique().to_dict()
+        doy_counts = df.groupby("year", sort=False)["doy"].nunique().to_dict()
         print(f"Unique DOY counts by year (reported days): {doy_counts}")
         print("Head:\n", df.head(10))
 
@@ -165,7 +176,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 0
 
     # Summary after prepare (always print concise summary)
-    days_by_year = prep.groupby("year")["doy"].nunique().to_dict()
+    days_by_year = prep.groupby("year", sort=False)["doy"].nunique().to_dict()
     print(f"Prepared window days per year: {days_by_year}")
 
     if args.verbose:
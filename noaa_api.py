@@ -1,27 +1,103 @@
+import hashlib
+import json
+import random
+import numpy as np
 import requests
 import pandas as pd
 from pandas import DataFrame
 from math import radians, sin, cos, asin, sqrt
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Union, Optional
-from datetime import date, datetime
+from datetime import date
 
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:  # optional: ~2-3x faster JSON decode on the 1000-row daily payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional: JIT-compile the scalar haversine fast path
+    import numba
+except ImportError:
+    numba = None
+
+try:  # optional: incremental JSON parsing bounds memory on large payloads
+    import ijson
+except ImportError:
+    ijson = None
+
 BASE = "https://www.ncdc.noaa.gov/cdo-web/api/v2"
 
 
+def _json(r: requests.Response):
+    """Decode a response body, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(r.content)
+    return r.json()
+
+
+def _cache_file(cache_dir: Path, station_id: str, year: int, units: str) -> Path:
+    key = hashlib.sha1(f"{station_id}|{year}|{units}".encode()).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def _cache_get(cache_dir: Optional[Path], station_id: str, year: int, units: str):
+    """
+    Return cached /data results for a closed past year, or None on a miss.
+    Current-year data is still accumulating and is never served from cache.
+    """
+    if cache_dir is None or year >= date.today().year:
+        return None
+    path = _cache_file(cache_dir, station_id, year, units)
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read()) if orjson is not None else json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_put(cache_dir: Optional[Path], station_id: str, year: int, units: str, pairs: list) -> None:
+    """Persist a closed past year's (date, value) pairs; best-effort only."""
+    if cache_dir is None or year >= date.today().year:
+        return
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = _cache_file(cache_dir, station_id, year, units)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(pairs) if orjson is not None else json.dumps(pairs).encode())
+    except OSError:
+        pass
+
+
+class _JitterRetry(Retry):
+    """Retry that adds a little random jitter to each backoff sleep, so
+    concurrent requests recovering from the same transient error don't
+    all retry in lockstep."""
+
+    def get_backoff_time(self) -> float:
+        return super().get_backoff_time() + random.uniform(0, 0.25)
+
+
 def _session_with_retries(
-    total: int = 5,
-    backoff_factor: float = 0.8,
-    status_forcelist: tuple = (429, 500, 502, 503, 504),
+    total: int = 6,
+    backoff_factor: float = 0.3,
+    status_forcelist: tuple = (408, 429, 500, 502, 503, 504),
 ) -> requests.Session:
     """
     Create a requests.Session with exponential backoff retries for transient errors.
-    Respects Retry-After headers from the server.
+    Respects Retry-After headers from the server (NOAA CDO sends one on 429);
+    the lower backoff factor keeps worst-case serial waits short when it doesn't.
+
+    The adapter's connection pool is sized for concurrent use so that
+    parallel callers reuse kept-alive sockets instead of churning new
+    TCP+TLS handshakes per request.
     """
     s = requests.Session()
-    retry = Retry(
+    retry = _JitterRetry(
         total=total,
         read=total,
         connect=total,
@@ -31,7 +107,12 @@ def _session_with_retries(
         respect_retry_after_header=True,
         raise_on_status=False,  # we'll call r.raise_for_status() ourselves
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=4,
+        pool_maxsize=32,
+        pool_block=False,
+    )
     s.mount("https://", adapter)
     s.mount("http://", adapter)
     return s
@@ -40,6 +121,12 @@ def _session_with_retries(
 _SESSION = _session_with_retries()
 
 
+@lru_cache(maxsize=8)
+def _headers(token: str) -> dict:
+    """Build (and reuse) the auth header dict for a token."""
+    return {"token": token}
+
+
 def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Compute the great-circle distance between two latitude/longitude points.
@@ -63,12 +150,46 @@ def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     - Assumes Earth radius of 6371 km.
     - Adequate for station proximity sorting (small to moderate distances).
     """
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+    lat1, lon1, lat2, lon2 = radians(lat1), radians(lon1), radians(lat2), radians(lon2)
     dlat, dlon = lat2 - lat1, lon2 - lon1
     a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
     return 2 * asin(sqrt(a)) * 6371.0  # km
 
 
+if numba is not None:
+    # Machine-code trig beats the Python math-module attribute lookups for
+    # repeated scalar calls; pure Python above remains the fallback.
+    _haversine = numba.njit(cache=True, fastmath=True)(_haversine)
+
+
+def _haversine_vec(lat1: float, lon1: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Vectorized haversine: distance from one reference point to many points.
+
+    Parameters
+    ----------
+    lat1, lon1 : float
+        Reference point in decimal degrees.
+    lats, lons : numpy.ndarray
+        Candidate latitudes/longitudes in decimal degrees.
+
+    Returns
+    -------
+    numpy.ndarray
+        Distances in kilometers, one per candidate point.
+
+    Notes
+    -----
+    Same spherical-Earth formula as `_haversine`, but evaluated with numpy
+    ufuncs so all candidates are scored in a single C-level pass.
+    """
+    lat1, lon1 = np.radians(lat1), np.radians(lon1)
+    lats, lons = np.radians(lats), np.radians(lons)
+    dlat, dlon = lats - lat1, lons - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lats) * np.sin(dlon / 2) ** 2
+    return 2 * np.arcsin(np.sqrt(a)) * 6371.0  # km
+
+
 def find_nearby_stations(
     token: str,
     lat: float,
@@ -82,7 +203,7 @@ def find_nearby_stations(
     - If return_details=False (default): returns a list of station IDs (strings), sorted by distance.
     - If return_details=True: returns a DataFrame of station details (incl. '_dist_km'), sorted by distance.
     """
-    headers = {"token": token}
+    headers = _headers(token)
     delta = 0.3  # ~20–35 km box around the point
     params = {
         "datasetid": "GHCND",
@@ -91,12 +212,29 @@ def find_nearby_stations(
     }
     r = _SESSION.get(f"{BASE}/stations", headers=headers, params=params, timeout=30)
     r.raise_for_status()
-    stations = r.json().get("results", []) or []
+    stations = _json(r).get("results", []) or []
+    if not stations:
+        return pd.DataFrame(stations) if return_details else []
+
+    n = len(stations)
+    lats = np.fromiter((s["latitude"] for s in stations), dtype=np.float64, count=n)
+    lons = np.fromiter((s["longitude"] for s in stations), dtype=np.float64, count=n)
+    k = min(max_nearby, n)
 
-    for s in stations:
-        s["_dist_km"] = _haversine(lat, lon, s["latitude"], s["longitude"])
+    # No coarse pre-filter: the request's 0.3-degree extent already caps
+    # Chebyshev distance at ~33 km, so every returned station survives
+    # any useful bound — score them all in the one vectorized pass.
+    dists = _haversine_vec(lat, lon, lats, lons)
 
-    sorted_stations = sorted(stations, key=lambda x: x["_dist_km"])[:max_nearby]
+    # Partial-select the k nearest, then sort just that small slice.
+    nearest = np.argpartition(dists, k)[:k] if k < n else np.arange(n)
+    nearest = nearest[np.argsort(dists[nearest], kind="stable")]
+
+    sorted_stations = []
+    for i in nearest:
+        s = stations[i]
+        s["_dist_km"] = float(dists[i])
+        sorted_stations.append(s)
     if return_details:
         return pd.DataFrame(sorted_stations)
     return [s["id"] for s in sorted_stations]
@@ -124,9 +262,19 @@ def has_full_prcp_coverage(
         if end_dt.year != year:
             end_dt = date(year, 12, 31) if year < today.year else today
 
+    return _coverage_probe(token, station_id, year, end_dt.isoformat(), units)
+
+
+@lru_cache(maxsize=512)
+def _coverage_probe(token: str, station_id: str, year: int, end_iso: str, units: str) -> bool:
+    """
+    Cached coverage check for a fully-normalized (station, year, end date, units)
+    key, so re-probing the same station within a run skips the NOAA call.
+    """
+    end_dt = date.fromisoformat(end_iso)
     expected_days = (end_dt - date(year, 1, 1)).days + 1
 
-    headers = {"token": token}
+    headers = _headers(token)
     params = {
         "datasetid": "GHCND",
         "stationid": station_id,
@@ -138,19 +286,20 @@ def has_full_prcp_coverage(
     }
     r = _SESSION.get(f"{BASE}/data", headers=headers, params=params, timeout=60)
     r.raise_for_status()
-    results = r.json().get("results", []) or []
+    results = _json(r).get("results", []) or []
     if not results:
         return False
 
-    seen = set()
-    for row in results:
-        d = row["date"][:10]  # YYYY-MM-DD
-        if d.startswith(f"{year}-"):
-            dt = datetime.strptime(d, "%Y-%m-%d").date()
-            if dt <= end_dt:
-                seen.add(dt.timetuple().tm_yday)
+    # Parse all dates in one vectorized pass instead of per-row strptime.
+    dates = pd.to_datetime(
+        pd.Series([row["date"][:10] for row in results]),
+        format="%Y-%m-%d",
+        cache=True,
+    )
+    mask = (dates.dt.year == year) & (dates <= pd.Timestamp(end_dt))
+    seen_days = dates[mask].dt.dayofyear.nunique()
 
-    return len(seen) >= expected_days
+    return seen_days >= expected_days
 
 
 def find_nearby_station(
@@ -169,15 +318,26 @@ def find_nearby_station(
     nearby candidates, return None.
     """
     details = find_nearby_stations(token, lat, lon, max_nearby=max_nearby, return_details=True)
-    if isinstance(details, pd.DataFrame) and not details.empty:
-        for _, row in details.iterrows():
-            sid = row["id"]
-            try:
-                if has_full_prcp_coverage(token, sid, year, end_date=end_date, units=units):
-                    return sid
-            except Exception:
-                # Skip stations that error/rate-limit, continue to next closest
-                continue
+    if not (isinstance(details, pd.DataFrame) and not details.empty):
+        return None
+
+    sids = details["id"].tolist()
+
+    def _probe(sid: str) -> bool:
+        try:
+            return has_full_prcp_coverage(token, sid, year, end_date=end_date, units=units)
+        except Exception:
+            # Treat stations that error/rate-limit as lacking coverage
+            return False
+
+    # Probe all candidates concurrently to overlap the network latency,
+    # then pick the closest hit — sids is already sorted by distance.
+    with ThreadPoolExecutor(max_workers=min(8, len(sids))) as executor:
+        covered = dict(zip(sids, executor.map(_probe, sids)))
+
+    for sid in sids:
+        if covered[sid]:
+            return sid
     return None
 
 
@@ -186,23 +346,36 @@ def fetch_precip_for_years(
     station_id: str,
     years: list[int],
     units: str,
+    *,
+    cache_dir: Optional[Path] = None,
 ) -> DataFrame:
     """
     Fetch daily precipitation (PRCP) for a station across multiple years.
 
+    Parameters
+    ----------
+    cache_dir : pathlib.Path, optional
+        If given, responses for closed past years (which are immutable) are
+        read from / written to this directory, skipping the HTTP call on
+        repeat runs. The current year is always fetched fresh.
+
     Returns
     -------
     pandas.DataFrame
         Columns: ["date", "year", "prcp", "doy"] where:
-            - date : pandas.Timestamp (UTC date)
+            - date : pandas.Timestamp (naive calendar date)
             - year : int (calendar year)
             - prcp : float (precip amount in requested units)
             - doy  : int (day of year, 1..366)
     """
-    headers = {"token": token}
-    all_rows = []
+    headers = _headers(token)
+    years = list(years)
 
-    for year in years:
+    def _fetch_year(year: int) -> list:
+        """Return the year's data as compact (YYYY-MM-DD, value) pairs."""
+        cached = _cache_get(cache_dir, station_id, year, units)
+        if cached is not None:
+            return cached
         params = {
             "datasetid": "GHCND",
             "stationid": station_id,
@@ -212,22 +385,60 @@ def fetch_precip_for_years(
             "limit": 1000,  # daily fits in one call
             "units": units,
         }
-        r = _SESSION.get(f"{BASE}/data", headers=headers, params=params, timeout=60)
-        r.raise_for_status()
-        for row in r.json().get("results", []) or []:
-            all_rows.append(
-                {
-                    "date": row["date"][:10],
-                    "year": year,
-                    "prcp": row.get("value", 0.0),
-                }
-            )
-
-    df = pd.DataFrame(all_rows)
-    if df.empty:
+        if ijson is not None:
+            # Stream rows out of the body as it arrives instead of buffering
+            # the full response and a decoded dict per day.
+            with _SESSION.get(
+                f"{BASE}/data", headers=headers, params=params, timeout=60, stream=True
+            ) as r:
+                r.raise_for_status()
+                r.raw.decode_content = True
+                # use_float: ijson otherwise yields decimal.Decimal values,
+                # which the JSON cache writer cannot serialize.
+                pairs = [
+                    (row["date"][:10], row.get("value", 0.0))
+                    for row in ijson.items(r.raw, "results.item", use_float=True)
+                ]
+        else:
+            r = _SESSION.get(f"{BASE}/data", headers=headers, params=params, timeout=60)
+            r.raise_for_status()
+            pairs = [
+                (row["date"][:10], row.get("value", 0.0))
+                for row in _json(r).get("results", []) or []
+            ]
+        _cache_put(cache_dir, station_id, year, units, pairs)
+        return pairs
+
+    # Accumulate columns, not per-row dicts: three flat lists instead of one
+    # hash table per day keeps row collection allocation-free.
+    dates: list = []
+    years_col: list = []
+    prcps: list = []
+    if years:
+        # One HTTPS round-trip per year; overlap them — the GIL is released
+        # during socket I/O and the session pool handles keep-alive reuse.
+        # executor.map preserves the input year order in the output.
+        with ThreadPoolExecutor(max_workers=min(8, len(years))) as executor:
+            for year, pairs in zip(years, executor.map(_fetch_year, years)):
+                dates.extend(p[0] for p in pairs)
+                years_col.extend([year] * len(pairs))
+                prcps.extend(p[1] for p in pairs)
+
+    if not dates:
         # Return a consistent, typed empty frame
         return pd.DataFrame(columns=["date", "year", "prcp", "doy"])
 
-    df["date"] = pd.to_datetime(df["date"], utc=True)
-    df["doy"] = df["date"].dt.dayofyear
-    return df
+    # Strict ISO parse straight to day precision — no timezone-aware
+    # conversion, and DOY falls out of integer date arithmetic instead of
+    # a .dt accessor pass.
+    d64 = np.asarray(dates, dtype="datetime64[D]")
+    doy = (d64 - d64.astype("datetime64[Y]")).astype(np.int16) + 1
+    return pd.DataFrame(
+        {
+            "date": d64,
+            # Narrow dtypes: years/DOY fit int16, daily precip fits float32.
+            "year": np.asarray(years_col, dtype=np.int16),
+            "prcp": np.asarray(prcps, dtype=np.float32),
+            "doy": doy,
+        }
+    )
@@ -5,7 +5,9 @@ from datetime import date, datetime
 from typing import Optional, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from matplotlib.collections import LineCollection
 
 
 def _end_label(end_date: Optional[date]) -> date:
@@ -27,10 +29,31 @@ def _unit_label(units: str) -> str:
     return "in" if units == "standard" else "mm"
 
 
-def plot_cumulative(
+def _year_slices(df: pd.DataFrame, y_col: str):
+    """
+    Yield (year, doy_array, y_array) per year as raw numpy slices.
+
+    The prepare_* functions emit frames contiguous and sorted by year, so
+    year boundaries can be found with one comparison pass and np.split —
+    no pandas groupby machinery per plot call.
+    """
+    years = df["year"].to_numpy()
+    if len(years) == 0:
+        return iter(())
+    bounds = np.flatnonzero(years[1:] != years[:-1]) + 1
+    doy_arrs = np.split(df["doy"].to_numpy(), bounds)
+    y_arrs = np.split(df[y_col].to_numpy(), bounds)
+    unique_years = years[np.r_[0, bounds]]
+    return zip(unique_years, doy_arrs, y_arrs)
+
+
+def _plot_series(
     df: pd.DataFrame,
     *,
-    units: str = "standard",
+    y_col: str,
+    y_label: str,
+    default_title_prefix: str,
+    func_name: str,
     end_date: Optional[date] = None,
     highlight_year: Optional[int] = None,
     station_name: Optional[str] = None,
@@ -40,31 +63,14 @@ def plot_cumulative(
     ax: Optional[plt.Axes] = None,
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
-    Plot cumulative precipitation curves per year.
-
-    Expects a DataFrame (e.g., from rainfall.prepare_cumulative) with columns:
-      - 'year' (int)
-      - 'doy'  (int)
-      - 'cum'  (float)  # cumulative precipitation
-
-    Parameters
-    ----------
-    units : "standard" for inches, "metric" for mm (axis label only)
-    end_date : used for the default title
-    highlight_year : emphasize one year's line (defaults to current year)
-    station_name : optional prefix for the title
-    title : custom plot title; if None a default is constructed
-    show : call plt.show() if True
-    save_path : if provided, save the figure to this path
-    ax : optional Axes to plot on
+    Shared per-year line-plot kernel behind the public plot_* wrappers.
 
-    Returns
-    -------
-    (fig, ax)
+    Draws one line per year from the (year, doy, y_col) columns of `df`,
+    emphasizing `highlight_year`, and handles title/labels/legend/save.
     """
-    required = {"year", "doy", "cum"}
+    required = {"year", "doy", y_col}
     if not required.issubset(df.columns):
-        raise ValueError("plot_cumulative expects df with columns: 'year','doy','cum'.")
+        raise ValueError(f"{func_name} expects df with columns: 'year','doy','{y_col}'.")
 
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 6))
@@ -74,23 +80,35 @@ def plot_cumulative(
     if highlight_year is None:
         highlight_year = date.today().year
 
-    unit_lbl = _unit_label(units)
     end_lbl = _end_label(end_date).isoformat()
 
-    # One line per year
-    for yr, g in df.groupby("year", sort=True):
-        lw = 2.6 if yr == highlight_year else 1.4
-        alpha = 1.0 if yr == highlight_year else 0.85
-        z = 3 if yr == highlight_year else 1
-        ax.plot(g["doy"], g["cum"], label=str(yr), linewidth=lw, alpha=alpha, zorder=z)
+    # Batch all non-highlighted years into a single LineCollection (one
+    # artist, one draw call); only the highlighted year stays a Line2D so
+    # it can be styled distinctly. Colors come from the axes prop cycle,
+    # with empty proxy lines supplying per-year legend entries.
+    cycle = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    segments, seg_colors = [], []
+    for i, (yr, doy_arr, y_arr) in enumerate(_year_slices(df, y_col)):
+        color = cycle[i % len(cycle)]
+        if yr == highlight_year:
+            ax.plot(doy_arr, y_arr, label=str(yr), color=color, linewidth=2.6, zorder=3)
+        else:
+            segments.append(np.column_stack([doy_arr, y_arr]))
+            seg_colors.append(color)
+            ax.plot([], [], label=str(yr), color=color, linewidth=1.4, alpha=0.85)
+
+    if segments:
+        lc = LineCollection(segments, colors=seg_colors, linewidths=1.4, alpha=0.85, zorder=1)
+        ax.add_collection(lc, autolim=True)
+        ax.autoscale_view()
 
     ax.set_xlabel("Day of Year")
-    ax.set_ylabel(f"Cumulative Precipitation ({unit_lbl})")
+    ax.set_ylabel(y_label)
     ax.grid(True, alpha=0.3)
     ax.legend(ncol=2, fontsize=9)
 
     if title is None:
-        base = f"Cumulative Rainfall (Jan 1 to {end_lbl})"
+        base = f"{default_title_prefix} (Jan 1 to {end_lbl})"
         if station_name:
             base = f"{station_name} — {base}"
         title = base
@@ -105,6 +123,57 @@ def plot_cumulative(
     return fig, ax
 
 
+def plot_cumulative(
+    df: pd.DataFrame,
+    *,
+    units: str = "standard",
+    end_date: Optional[date] = None,
+    highlight_year: Optional[int] = None,
+    station_name: Optional[str] = None,
+    title: Optional[str] = None,
+    show: bool = True,
+    save_path: Optional[str] = None,
+    ax: Optional[plt.Axes] = None,
+) -> Tuple[plt.Figure, plt.Axes]:
+    """
+    Plot cumulative precipitation curves per year.
+
+    Expects a DataFrame (e.g., from rainfall.prepare_cumulative) with columns:
+      - 'year' (int)
+      - 'doy'  (int)
+      - 'cum'  (float)  # cumulative precipitation
+
+    Parameters
+    ----------
+    units : "standard" for inches, "metric" for mm (axis label only)
+    end_date : used for the default title
+    highlight_year : emphasize one year's line (defaults to current year)
+    station_name : optional prefix for the title
+    title : custom plot title; if None a default is constructed
+    show : call plt.show() if True
+    save_path : if provided, save the figure to this path
+    ax : optional Axes to plot on
+
+    Returns
+    -------
+    (fig, ax)
+    """
+    return _plot_series(
+        df,
+        y_col="cum",
+        y_label=f"Cumulative Precipitation ({_unit_label(units)})",
+        default_title_prefix="Cumulative Rainfall",
+        func_name="plot_cumulative",
+        end_date=end_date,
+        highlight_year=highlight_year,
+        station_name=station_name,
+        title=title,
+        show=show,
+        save_path=save_path,
+        ax=ax,
+    )
+
+
 def plot_cumulative_rain_days(
     df: pd.DataFrame,
     *,
@@ -138,42 +207,17 @@ def plot_cumulative_rain_days(
     -------
     (fig, ax)
     """
-    required = {"year", "doy", "cum_rain_days"}
-    if not required.issubset(df.columns):
-        raise ValueError("plot_cumulative_rain_days expects df with ['year','doy','cum_rain_days'].")
-
-    if ax is None:
-        fig, ax = plt.subplots(figsize=(10, 6))
-    else:
-        fig = ax.figure
-
-    if highlight_year is None:
-        highlight_year = date.today().year
-
-    end_lbl = _end_label(end_date).isoformat()
-
-    for yr, g in df.groupby("year", sort=True):
-        lw = 2.6 if yr == highlight_year else 1.4
-        alpha = 1.0 if yr == highlight_year else 0.85
-        z = 3 if yr == highlight_year else 1
-        ax.plot(g["doy"], g["cum_rain_days"], label=str(yr), linewidth=lw, alpha=alpha, zorder=z)
-
-    ax.set_xlabel("Day of Year")
-    ax.set_ylabel("Cumulative Rain Days")
-    ax.grid(True, alpha=0.3)
-    ax.legend(ncol=2, fontsize=9)
-
-    if title is None:
-        base = f"Cumulative Rain Days (Jan 1 to {end_lbl})"
-        if station_name:
-            base = f"{station_name} — {base}"
-        title = base
-    ax.set_title(title)
-
-    fig.tight_layout()
-    if save_path:
-        fig.savefig(save_path, dpi=150, bbox_inches="tight")
-    if show:
-        plt.show()
-
-    return fig, ax
+    return _plot_series(
+        df,
+        y_col="cum_rain_days",
+        y_label="Cumulative Rain Days",
+        default_title_prefix="Cumulative Rain Days",
+        func_name="plot_cumulative_rain_days",
+        end_date=end_date,
+        highlight_year=highlight_year,
+        station_name=station_name,
+        title=title,
+        show=show,
+        save_path=save_path,
+        ax=ax,
+    )
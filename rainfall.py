@@ -2,14 +2,28 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+import numpy as np
 import pandas as pd
 
+try:  # optional: parallel fill+cumsum kernel for large multi-year batches
+    import numba
+except ImportError:
+    numba = None
+
+try:  # optional: lazy query-fused engine for the prepare pipelines
+    import polars as pl
+except ImportError:
+    pl = None
+
 
 __all__ = [
     "_end_doy",
+    "count_rain_days",
     "prepare_cumulative",
+    "prepare_cumulative_iter",
+    "prepare_cumulative_matrix",
     "prepare_cumulative_rain_days",
 ]
 
@@ -23,31 +37,129 @@ def _end_doy(end_date: Optional[date] = None) -> int:
         end = date.today()
     else:
         end = end_date.date() if isinstance(end_date, datetime) else end_date
-    return end.timetuple().tm_yday
+    # Shifted-year (March-anchored) day count: pure integer ops, no
+    # intermediate date/timedelta objects. For Mar..Dec add the 59/60 days
+    # of Jan+Feb; for Jan/Feb subtract the 306 days of Mar..Dec.
+    y, m, d = end.year, end.month, end.day
+    mp = m - 3 if m >= 3 else m + 9
+    from_mar = (153 * mp + 2) // 5 + d
+    if m < 3:
+        return from_mar - 306
+    leap = y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)
+    return from_mar + 59 + leap
+
+
+# Last few prepared outputs, keyed by a cheap input fingerprint (FIFO).
+# Interactive use re-prepares the same fetched frame repeatedly; a hit
+# skips the densify + cumsum work entirely.
+_PREP_CACHE: dict[tuple, pd.DataFrame] = {}
+_PREP_CACHE_MAX = 4
+
+
+def _prep_fingerprint(df: pd.DataFrame, end_doy: int, start_day: int) -> Optional[tuple]:
+    """
+    Cheap identity for memoizing prepared output, or None if the input
+    cannot be fingerprinted. The prcp sum (one C pass) guards against
+    silent in-place edits of a frame with an unchanged id/shape. Only the
+    known-scalar 'year'/'prcp' columns feed the key — extra columns may
+    hold unhashable values (lists, dicts) that would break the dict lookup.
+    """
+    if "prcp" not in df.columns or "year" not in df.columns:
+        return None
+    try:
+        prcp_sum = float(df["prcp"].sum())
+        if len(df):
+            first = (int(df["year"].iloc[0]), float(df["prcp"].iloc[0]))
+            last = (int(df["year"].iloc[-1]), float(df["prcp"].iloc[-1]))
+        else:
+            first = last = None
+    except (TypeError, ValueError):
+        return None
+    return (id(df), df.shape, first, last, prcp_sum, end_doy, start_day)
 
 
 def _ensure_doy(df: pd.DataFrame, *, func_name: str) -> pd.DataFrame:
     """
-    Ensure there is a 'doy' column; if not, derive from 'date'.
-    Returns a copy of the input with a 'doy' column.
+    Return a frame with 'year', 'prcp' and 'doy' columns, deriving 'doy'
+    from 'date' when needed. Never copies the caller's DataFrame: the
+    derived case builds a minimal new frame from the input's arrays, and
+    the pass-through case returns `df` itself (downstream code only
+    filters and aggregates, it never writes into the input).
     """
-    if "doy" in df.columns:
-        return df.copy()
+    cols = frozenset(df.columns)
+    if "doy" in cols:
+        return df
 
-    if "date" not in df.columns:
+    if "date" not in cols:
         raise ValueError(f"{func_name} requires 'doy' or 'date' column")
 
-    d = df.copy()
-    d["date"] = pd.to_datetime(d["date"], utc=True, errors="coerce")
-    d = d.dropna(subset=["date"])
-    d["doy"] = d["date"].dt.dayofyear
-    return d
-
-
-def _validate_basics(df: pd.DataFrame, *, required: tuple[str, ...], func_name: str) -> None:
-    missing = [c for c in required if c not in df.columns]
+    s = df["date"]
+    if pd.api.types.is_datetime64_any_dtype(s):
+        if isinstance(s.dtype, pd.DatetimeTZDtype):
+            # Only the calendar day matters here; keep wall time, drop the tz.
+            s = s.dt.tz_localize(None)
+        d64 = s.to_numpy().astype("datetime64[D]")
+    else:
+        try:
+            # Strict ISO parse straight to day precision — one numpy C
+            # loop, no pandas datetime machinery. NOAA dates are clean
+            # fixed-width YYYY-MM-DD, so this is the path that runs.
+            d64 = np.asarray(s.to_numpy(), dtype="datetime64[D]")
+        except (ValueError, TypeError):
+            # Messy input: fall back to pandas' generic parser — the
+            # documented contract is any parseable 'date', not just ISO —
+            # coercing bad rows to NaT for the drop below.
+            d64 = (
+                pd.to_datetime(s, errors="coerce")
+                .to_numpy()
+                .astype("datetime64[D]")
+            )
+    year = df["year"].to_numpy()
+    prcp = df["prcp"].to_numpy()
+    ok = ~np.isnat(d64)
+    if not ok.all():
+        d64, year, prcp = d64[ok], year[ok], prcp[ok]
+    # DOY = days since Jan 1 of the same year, + 1: a single vectorized
+    # datetime64 subtraction instead of the .dt.dayofyear accessor.
+    doy = ((d64 - d64.astype("datetime64[Y]")).astype("int64") + 1).astype(np.int32)
+    return pd.DataFrame({"year": year, "prcp": prcp, "doy": doy})
+
+
+# Required-column sets, precomputed once so validation is a single
+# set-difference instead of per-name Index membership probes.
+_REQ_PREPARE = frozenset({"year", "prcp"})
+_REQ_COUNT = frozenset({"date", "prcp"})
+
+
+def _validate_basics(df: pd.DataFrame, *, required: frozenset, func_name: str) -> None:
+    missing = required.difference(df.columns)
     if missing:
-        raise ValueError(f"{func_name} requires columns: {list(required)} (missing {missing})")
+        raise ValueError(f"{func_name} requires columns: {sorted(required)} (missing {sorted(missing)})")
+
+
+def _empty_cumulative() -> pd.DataFrame:
+    """Schema-correct empty output for prepare_cumulative: the dtypes are
+    pinned so downstream consumers never see object columns."""
+    return pd.DataFrame(
+        {
+            "year": pd.Series([], dtype=np.int16),
+            "doy": pd.Series([], dtype=np.int16),
+            "prcp": pd.Series([], dtype=np.float32),
+            "cum": pd.Series([], dtype=np.float32),
+        }
+    )
+
+
+def _empty_rain_days() -> pd.DataFrame:
+    """Schema-correct empty output for prepare_cumulative_rain_days."""
+    return pd.DataFrame(
+        {
+            "year": pd.Series(pd.Categorical(np.array([], dtype=np.int16), ordered=True)),
+            "doy": pd.Series([], dtype=np.int16),
+            "rain_day": pd.Series([], dtype=np.int8),
+            "cum_rain_days": pd.Series([], dtype=np.int32),
+        }
+    )
 
 
 def _clamp_start_day(start_day: int) -> int:
@@ -57,45 +169,195 @@ def _clamp_start_day(start_day: int) -> int:
     return sd
 
 
-def _prepare_base_precip(
+def _window_arrays(
     df: pd.DataFrame,
     end_date: Optional[date],
     start_day: int,
     *,
     func_name: str,
-) -> pd.DataFrame:
+):
     """
     Shared prep step for cumulative series.
     - Validates required columns
     - Ensures 'doy' exists (derives from 'date' if needed)
     - Computes [start_day..end_doy] window
-    - Fills missing days with 0.0 precipitation
-    Returns a DataFrame with columns ['year', 'doy', 'prcp'].
+
+    Returns (years, sd, end_doy, year_idx, col_idx, prcp) where `years`
+    is the sorted unique years and the last three are aligned arrays of
+    matrix coordinates + values for the in-window rows, ready to scatter
+    into a dense (n_years, n_days) matrix. `years` is None when the
+    window is empty.
     """
-    _validate_basics(df, required=("year", "prcp"), func_name=func_name)
+    _validate_basics(df, required=_REQ_PREPARE, func_name=func_name)
     work = _ensure_doy(df, func_name=func_name)
 
     end_doy = _end_doy(end_date)
     sd = _clamp_start_day(start_day)
 
     if sd > end_doy or work.empty:
-        return pd.DataFrame(columns=["year", "doy", "prcp"])
+        return None, sd, end_doy, None, None, None
+
+    # Window filter on the raw ndarrays: one fused integer-compare mask,
+    # applied once per column, instead of Series.between + frame indexing.
+    # Narrow dtypes on entry — float32 prcp halves the bytes the
+    # memory-bound scatter/cumsum kernels move, and daily precip totals
+    # sit far below float32's exact-integer range.
+    doy_arr = work["doy"].to_numpy(dtype=np.int16, copy=False)
+    years_arr = work["year"].to_numpy(dtype=np.int32, copy=False)
+    prcp = work["prcp"].to_numpy(dtype=np.float32, copy=False)
+    mask = (doy_arr >= sd) & (doy_arr <= end_doy)
+    if not mask.all():
+        if not mask.any():
+            return None, sd, end_doy, None, None, None
+        doy_arr, years_arr, prcp = doy_arr[mask], years_arr[mask], prcp[mask]
+
+    # return_inverse hands back the row codes in [0, Y) alongside the
+    # sorted unique years — no separate searchsorted pass.
+    years_unique, year_idx = np.unique(years_arr, return_inverse=True)
+    col_idx = doy_arr - sd
+    return years_unique, sd, end_doy, year_idx, col_idx, prcp
+
+
+def _scatter_prcp(year_idx, col_idx, prcp, n_years: int, n_days: int) -> np.ndarray:
+    """
+    Scatter prcp into a preallocated (n_years, n_days) matrix: zeros give
+    the missing-day fill for free and np.add.at sums duplicate (year, doy)
+    rows. No bounds mask needed — the window filter already clipped doy.
+    """
+    mat = np.zeros((n_years, n_days), dtype=np.float32)
+    np.add.at(mat, (year_idx, col_idx), prcp)
+    return mat
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _fill_and_cumsum(year_idx, col_idx, prcp, n_years, n_days):  # pragma: no cover
+        prcp_mat = np.zeros((n_years, n_days), dtype=np.float32)
+        for i in range(year_idx.shape[0]):
+            prcp_mat[year_idx[i], col_idx[i]] += prcp[i]
+        cum_mat = np.empty_like(prcp_mat)
+        for y in numba.prange(n_years):
+            running = np.float32(0.0)
+            for d in range(n_days):
+                running += prcp_mat[y, d]
+                cum_mat[y, d] = running
+        return prcp_mat, cum_mat
+
+    @numba.njit(parallel=True, cache=True)
+    def _fill_and_count(year_idx, col_idx, prcp, n_years, n_days, threshold):  # pragma: no cover
+        prcp_mat = np.zeros((n_years, n_days), dtype=np.float32)
+        for i in range(year_idx.shape[0]):
+            prcp_mat[year_idx[i], col_idx[i]] += prcp[i]
+        rain = np.empty((n_years, n_days), dtype=np.int8)
+        cum = np.empty((n_years, n_days), dtype=np.int32)
+        for y in numba.prange(n_years):
+            acc = 0
+            for d in range(n_days):
+                r = 1 if prcp_mat[y, d] > threshold else 0
+                acc += r
+                rain[y, d] = r
+                cum[y, d] = acc
+        return rain, cum
+
+else:
+    _fill_and_cumsum = None
+    _fill_and_count = None
+
+# Below this many matrix cells the NumPy path beats the JIT call overhead.
+_NUMBA_MIN_CELLS = 50_000
+
+
+def _polars_filled(
+    df: pd.DataFrame,
+    end_date: Optional[date],
+    start_day: int,
+    *,
+    func_name: str,
+):
+    """
+    Shared LazyFrame plan for the engine="polars" branches: window filter,
+    duplicate-day aggregation, densification against the full (year, doy)
+    grid with 0.0 fill, and sort. Returns (lf, sd, end_doy) with lf None
+    when the window is empty; polars fuses the whole plan into one native
+    pass when the caller collects.
+    """
+    if pl is None:
+        raise ImportError(f"{func_name}(engine='polars') requires the optional polars dependency")
+    _validate_basics(df, required=_REQ_PREPARE, func_name=func_name)
+    work = _ensure_doy(df, func_name=func_name)
 
-    parts: list[pd.DataFrame] = []
-    for yr, g in work.groupby("year", sort=True):
-        gg = g[["doy", "prcp"]].copy()
-        gg = gg[gg["doy"].between(sd, end_doy)]
-        # Fill any missing days in the window with 0 precip
-        gg = gg.set_index("doy").reindex(range(sd, end_doy + 1), fill_value=0.0)
-        gg["year"] = yr
-        gg = gg.reset_index().rename(columns={"index": "doy"})
-        parts.append(gg[["year", "doy", "prcp"]])
+    end_doy = _end_doy(end_date)
+    sd = _clamp_start_day(start_day)
+    if sd > end_doy or work.empty:
+        return None, sd, end_doy
+
+    daily = (
+        pl.from_pandas(work[["year", "doy", "prcp"]])
+        .lazy()
+        .filter(pl.col("doy").is_between(sd, end_doy))
+        .group_by("year", "doy")
+        .agg(pl.col("prcp").sum())
+    )
+    grid = daily.select(pl.col("year").unique()).join(
+        pl.LazyFrame({"doy": np.arange(sd, end_doy + 1)}), how="cross"
+    )
+    filled = (
+        grid.join(daily, on=["year", "doy"], how="left")
+        .with_columns(pl.col("prcp").fill_null(0.0))
+        .sort("year", "doy")
+    )
+    return filled, sd, end_doy
+
+
+def _polars_collect(lf, columns: list) -> pd.DataFrame:
+    """
+    Collect a LazyFrame and rebuild a pandas frame from its numpy columns
+    (no pyarrow round-trip, same dict-of-ndarrays construction as the
+    numpy engine).
+    """
+    res = lf.select(columns).collect()
+    return pd.DataFrame({c: res[c].to_numpy() for c in columns}, copy=False)
 
-    if not parts:
-        return pd.DataFrame(columns=["year", "doy", "prcp"])
 
-    out = pd.concat(parts, ignore_index=True)
-    return out.sort_values(["year", "doy"], kind="stable").reset_index(drop=True)
+def _dense_window(
+    df: pd.DataFrame,
+    end_date: Optional[date],
+    start_day: int,
+    *,
+    func_name: str,
+):
+    """
+    Dense-matrix view of the window: returns (years, sd, end_doy, mat)
+    where `mat` is the (n_years, n_days) precip matrix with rows in
+    sorted year order and missing days filled with 0.0, or
+    (None, sd, end_doy, None) when the window is empty.
+    """
+    years, sd, end_doy, year_idx, col_idx, prcp = _window_arrays(
+        df, end_date, start_day, func_name=func_name
+    )
+    if years is None:
+        return None, sd, end_doy, None
+    mat = _scatter_prcp(year_idx, col_idx, prcp, len(years), end_doy - sd + 1)
+    return years, sd, end_doy, mat
+
+
+def _assemble_tall(years: np.ndarray, sd: int, end_doy: int, columns: dict) -> pd.DataFrame:
+    """
+    Build the tall output frame for a dense window: repeated year / tiled
+    doy key columns plus the given value columns (raveled matrices).
+    """
+    n_days = end_doy - sd + 1
+    # int16 comfortably holds both keys (years < 32768, doy <= 366) and
+    # halves the key columns' footprint versus int32.
+    data = {
+        "year": np.repeat(years.astype(np.int16, copy=False), n_days),
+        "doy": np.tile(np.arange(sd, end_doy + 1, dtype=np.int16), len(years)),
+    }
+    data.update(columns)
+    # Every column arrives as a typed ndarray, so copy=False adopts the
+    # buffers directly — no inference pass, no block consolidation copy.
+    return pd.DataFrame(data, copy=False)
 
 
 def prepare_cumulative(
@@ -103,6 +365,7 @@ def prepare_cumulative(
     end_date: Optional[date] = None,
     *,
     start_day: int = 1,
+    engine: str = "numpy",
 ) -> pd.DataFrame:
     """
     Build per-year cumulative precipitation starting the series at `start_day` (DOY)
@@ -121,6 +384,9 @@ def prepare_cumulative(
         Last date included for each year. If None, uses today's date.
     start_day : int, default 1
         First DOY to include (1..366).
+    engine : {"numpy", "polars"}, default "numpy"
+        "polars" runs the pipeline as a fused LazyFrame query (requires
+        the optional polars dependency); output is equivalent.
 
     Output
     ------
@@ -130,12 +396,100 @@ def prepare_cumulative(
       - 'prcp' : float (daily precipitation; missing days filled with 0.0)
       - 'cum'  : float (cumulative precipitation within the year starting at start_day)
     """
-    base = _prepare_base_precip(df, end_date, start_day, func_name="prepare_cumulative")
-    if base.empty:
-        return pd.DataFrame(columns=["year", "doy", "prcp", "cum"])
+    if engine == "polars":
+        filled, _, _ = _polars_filled(df, end_date, start_day, func_name="prepare_cumulative")
+        if filled is None:
+            return _empty_cumulative()
+        out = _polars_collect(
+            filled.with_columns(pl.col("prcp").cum_sum().over("year").alias("cum")),
+            ["year", "doy", "prcp", "cum"],
+        )
+        if out.empty:
+            return _empty_cumulative()
+        return out
+    if engine != "numpy":
+        raise ValueError(f"unknown engine: {engine!r}")
+
+    key = _prep_fingerprint(df, _end_doy(end_date), start_day)
+    if key is not None and key in _PREP_CACHE:
+        return _PREP_CACHE[key].copy()
+
+    years, sd, end_doy, year_idx, col_idx, prcp = _window_arrays(
+        df, end_date, start_day, func_name="prepare_cumulative"
+    )
+    if years is None:
+        return _empty_cumulative()
+
+    # Row-wise cumsum on the dense (year x day) matrix: one contiguous C
+    # pass replaces the flat cumsum + per-year boundary-offset bookkeeping.
+    # Large batches take the fused numba kernel (scatter + per-year cumsum
+    # in one parallel pass) when the optional dependency is installed.
+    n_days = end_doy - sd + 1
+    if _fill_and_cumsum is not None and len(years) * n_days >= _NUMBA_MIN_CELLS:
+        mat, cum = _fill_and_cumsum(
+            year_idx.astype(np.int64), col_idx.astype(np.int64), prcp, len(years), n_days
+        )
+    else:
+        mat = _scatter_prcp(year_idx, col_idx, prcp, len(years), n_days)
+        cum = np.cumsum(mat, axis=1)
+    out = _assemble_tall(years, sd, end_doy, {"prcp": mat.ravel(), "cum": cum.ravel()})
+
+    if key is not None:
+        if len(_PREP_CACHE) >= _PREP_CACHE_MAX:
+            _PREP_CACHE.pop(next(iter(_PREP_CACHE)))
+        _PREP_CACHE[key] = out.copy()
+    return out
 
-    base["cum"] = base.groupby("year", sort=True)["prcp"].cumsum()
-    return base[["year", "doy", "prcp", "cum"]]
+
+def prepare_cumulative_matrix(
+    df: pd.DataFrame,
+    end_date: Optional[date] = None,
+    *,
+    start_day: int = 1,
+) -> tuple:
+    """
+    Dense-array variant of prepare_cumulative for callers that only need
+    per-year curves (e.g. plotting one line per year): skips the tall
+    melt entirely and hands back contiguous per-year rows.
+
+    Returns (years, doys, cum_matrix) where cum_matrix has shape
+    (len(years), len(doys)), rows in sorted year order; row i is year
+    years[i]'s cumulative precipitation over `doys`. An empty window
+    yields empty arrays.
+    """
+    years, sd, end_doy, mat = _dense_window(
+        df, end_date, start_day, func_name="prepare_cumulative_matrix"
+    )
+    if mat is None:
+        return (
+            np.array([], dtype=np.int32),
+            np.array([], dtype=np.int32),
+            np.empty((0, 0), dtype=np.float32),
+        )
+    doys = np.arange(sd, end_doy + 1, dtype=np.int32)
+    return years.astype(np.int32, copy=False), doys, np.cumsum(mat, axis=1)
+
+
+def prepare_cumulative_iter(
+    frames: Iterable[pd.DataFrame],
+    end_date: Optional[date] = None,
+    *,
+    start_day: int = 1,
+) -> Iterator[tuple]:
+    """
+    Streaming variant of prepare_cumulative for multi-station batches:
+    consume an iterable of daily-precip DataFrames and yield
+    (year, doys, cum_row) one year at a time, so a batch loop can draw
+    or aggregate each curve and drop it — peak memory stays one
+    station's dense window instead of every station's prepared frame.
+
+    `doys` is shared across the years of one input frame; `cum_row` is
+    that year's cumulative precipitation (float32).
+    """
+    for frame in frames:
+        years, doys, cum = prepare_cumulative_matrix(frame, end_date, start_day=start_day)
+        for year, row in zip(years, cum):
+            yield int(year), doys, row
 
 
 def prepare_cumulative_rain_days(
@@ -144,12 +498,13 @@ def prepare_cumulative_rain_days(
     *,
     threshold: float = 0.0,
     start_day: int = 1,
+    engine: str = "numpy",
 ) -> pd.DataFrame:
     """
     Transform daily precipitation into a per-year cumulative *count of rainy days*,
     starting the series at `start_day` (DOY) through `end_date`.
 
-    A day is considered a "rain day" iff prcp >= `threshold`. Choose `threshold`
+    A day is considered a "rain day" iff prcp > `threshold`. Choose `threshold`
     according to your units (e.g., 0.01 for inches, ~0.25 for mm).
 
     Input
@@ -162,25 +517,163 @@ def prepare_cumulative_rain_days(
     Parameters
     ----------
     threshold : float, default 0.0
-        Minimum precipitation to count as a rain day (inclusive).
+        Precipitation must exceed this value to count as a rain day.
     end_date : date or datetime, optional
         Last date included for each year. If None, uses today's date.
     start_day : int, default 1
         First DOY to include (1..366).
+    engine : {"numpy", "polars"}, default "numpy"
+        "polars" runs the pipeline as a fused LazyFrame query (requires
+        the optional polars dependency); output is equivalent.
 
     Output
     ------
     DataFrame with columns:
-      - 'year'          : int
+      - 'year'          : ordered categorical (int categories)
       - 'doy'           : int in [start_day .. end_doy]
       - 'rain_day'      : int in {0,1}
       - 'cum_rain_days' : int (cumulative count within the year starting at start_day)
     """
-    base = _prepare_base_precip(df, end_date, start_day, func_name="prepare_cumulative_rain_days")
-    if base.empty:
-        return pd.DataFrame(columns=["year", "doy", "rain_day", "cum_rain_days"])
+    if engine == "polars":
+        filled, _, _ = _polars_filled(
+            df, end_date, start_day, func_name="prepare_cumulative_rain_days"
+        )
+        if filled is None:
+            return _empty_rain_days()
+        out = _polars_collect(
+            filled.with_columns((pl.col("prcp") > threshold).cast(pl.Int8).alias("rain_day"))
+            .with_columns(
+                pl.col("rain_day").cum_sum().over("year").cast(pl.Int32).alias("cum_rain_days")
+            ),
+            ["year", "doy", "rain_day", "cum_rain_days"],
+        )
+        if out.empty:
+            return _empty_rain_days()
+        out["year"] = pd.Categorical(out["year"], ordered=True)
+        return out
+    if engine != "numpy":
+        raise ValueError(f"unknown engine: {engine!r}")
+
+    years, sd, end_doy, year_idx, col_idx, prcp = _window_arrays(
+        df, end_date, start_day, func_name="prepare_cumulative_rain_days"
+    )
+    if years is None:
+        return _empty_rain_days()
+
+    # Strict comparison: a filled missing day (0.0) never counts as rain at
+    # the default threshold. Large batches take the fused numba kernel
+    # (scatter + threshold + running count, one pass, no temporaries);
+    # otherwise the row-wise cumsum consumes the boolean matrix directly,
+    # with the int8 view of the bool array giving the 0/1 indicator column
+    # zero-copy (same itemsize).
+    n_days = end_doy - sd + 1
+    if _fill_and_count is not None and len(years) * n_days >= _NUMBA_MIN_CELLS:
+        rain_mat, cum = _fill_and_count(
+            year_idx.astype(np.int64),
+            col_idx.astype(np.int64),
+            prcp,
+            len(years),
+            n_days,
+            np.float32(threshold),
+        )
+        rain_col = rain_mat.ravel()
+    else:
+        mat = _scatter_prcp(year_idx, col_idx, prcp, len(years), n_days)
+        # Strict > for every threshold, matching the numba kernel and the
+        # polars engine: NaN precip propagates through the scatter into
+        # `mat`, and NaN > t is False (not a rain day), where a nonzero
+        # test would count it. One vectorized float32 compare either way.
+        rain = mat > np.float32(threshold)
+        cum = np.cumsum(rain, axis=1, dtype=np.int32)
+        rain_col = rain.ravel().view(np.int8)
+    out = _assemble_tall(
+        years, sd, end_doy,
+        {"rain_day": rain_col, "cum_rain_days": cum.ravel()},
+    )
+    # Ordered categorical year: downstream per-year groupbys run on the
+    # small codes instead of rehashing values, and comparisons like
+    # out["year"] == 2024 still work.
+    out["year"] = pd.Categorical(out["year"], ordered=True)
+    return out
+
+
+def count_rain_days(
+    df: pd.DataFrame,
+    start_date=None,
+    end_date=None,
+    threshold: float = 0.0,
+) -> dict:
+    """
+    Count rain vs. no-rain days over a calendar window [start_date .. end_date].
+
+    Days missing from `df` count as 0.0 precipitation; duplicate rows for the
+    same day are summed before classification. A day is a "rain day" iff its
+    total prcp > `threshold` (same strict rule as prepare_cumulative_rain_days).
+
+    Input
+    -----
+    df : DataFrame with at least 'date' (parseable) and 'prcp' (float).
 
-    # Inclusive threshold (>=), as requested.
-    base["rain_day"] = (base["prcp"] >= threshold).astype(int)
-    base["cum_rain_days"] = base.groupby("year", sort=True)["rain_day"].cumsum()
-    return base[["year", "doy", "rain_day", "cum_rain_days"]]
+    Parameters
+    ----------
+    start_date, end_date : date-like, optional
+        Inclusive window bounds. end_date defaults to today; start_date
+        defaults to Jan 1 of end_date's year.
+    threshold : float, default 0.0
+        Precipitation must exceed this value to count as a rain day.
+
+    Output
+    ------
+    dict with 'total_days', 'no_rain_days' and 'rain_days' counts. Empty
+    input returns all zeros.
+    """
+    _validate_basics(df, required=_REQ_COUNT, func_name="count_rain_days")
+    if df.empty:
+        return {"total_days": 0, "no_rain_days": 0, "rain_days": 0}
+
+    end = pd.Timestamp(end_date) if end_date is not None else pd.Timestamp(date.today())
+    start = pd.Timestamp(start_date) if start_date is not None else end.replace(month=1, day=1)
+    if start > end:
+        return {"total_days": 0, "no_rain_days": 0, "rain_days": 0}
+
+    # Operate on the input's arrays directly — no defensive df.copy().
+    # Branch on dtype so already-typed datetime columns never re-parse:
+    # tz-aware input just drops its tz (only the calendar day matters),
+    # typed input passes straight through. Day bucketing is then a cast
+    # to datetime64[D], not a groupby.
+    s = df["date"]
+    if isinstance(s.dtype, pd.DatetimeTZDtype):
+        s = s.dt.tz_localize(None)
+    if pd.api.types.is_datetime64_any_dtype(s):
+        day = s.to_numpy().astype("datetime64[D]")
+    else:
+        try:
+            # Strict ISO parse straight to day precision — the same fast
+            # path as _ensure_doy, covering NOAA's clean YYYY-MM-DD input.
+            day = np.asarray(s.to_numpy(), dtype="datetime64[D]")
+        except (ValueError, TypeError):
+            # Messy input: generic parser, coercing bad rows to NaT —
+            # the documented contract is any parseable 'date', not just ISO.
+            day = (
+                pd.to_datetime(s, errors="coerce")
+                .to_numpy()
+                .astype("datetime64[D]")
+            )
+    prcp = df["prcp"].to_numpy(dtype=np.float64)
+
+    # Histogram per-day totals directly: each date maps to its offset from
+    # start_date, so one bincount both collapses duplicates and zero-fills
+    # missing days (NaT offsets go hugely negative and fall to the mask).
+    start64 = np.datetime64(start.date(), "D")
+    end64 = np.datetime64(end.date(), "D")
+    total_days = int((end64 - start64).astype(np.int64)) + 1
+    day_int = (day - start64).astype(np.int64)
+    in_win = (day_int >= 0) & (day_int < total_days)
+    totals = np.bincount(day_int[in_win], weights=prcp[in_win], minlength=total_days)
+
+    rain_days = int(np.count_nonzero(totals > threshold))
+    return {
+        "total_days": total_days,
+        "no_rain_days": total_days - rain_days,
+        "rain_days": rain_days,
+    }
@@ -0,0 +1,47 @@
+import datetime as dt
+import pandas as pd
+
+from noaa_api import fetch_precip_for_years, BASE
+
+
+def _precip_payload(year):
+    return {
+        "results": [
+            {"date": f"{year}-01-01T00:00:00", "value": 1.0},
+            {"date": f"{year}-01-02T00:00:00", "value": 2.5},
+        ]
+    }
+
+
+def test_fetch_precip_past_year_round_trips_disk_cache(tmp_path, requests_mock):
+    year = 2020  # closed past year: eligible for caching
+    requests_mock.get(f"{BASE}/data", json=_precip_payload(year), status_code=200)
+
+    df1 = fetch_precip_for_years("dummy", "GHCND:STATION_A", [year], "standard", cache_dir=tmp_path)
+    assert requests_mock.call_count == 1
+    assert list(tmp_path.glob("*.json"))  # response persisted
+
+    # Second fetch is served from disk — no new HTTP call, same frame
+    df2 = fetch_precip_for_years("dummy", "GHCND:STATION_A", [year], "standard", cache_dir=tmp_path)
+    assert requests_mock.call_count == 1
+    pd.testing.assert_frame_equal(df1, df2)
+
+
+def test_fetch_precip_current_year_never_cached(tmp_path, requests_mock):
+    year = dt.date.today().year
+    requests_mock.get(f"{BASE}/data", json=_precip_payload(year), status_code=200)
+
+    fetch_precip_for_years("dummy", "GHCND:STATION_A", [year], "standard", cache_dir=tmp_path)
+    fetch_precip_for_years("dummy", "GHCND:STATION_A", [year], "standard", cache_dir=tmp_path)
+    # Still-open year is fetched fresh each time and leaves no cache file
+    assert requests_mock.call_count == 2
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_fetch_precip_no_cache_dir_never_touches_disk(tmp_path, requests_mock):
+    requests_mock.get(f"{BASE}/data", json=_precip_payload(2020), status_code=200)
+
+    fetch_precip_for_years("dummy", "GHCND:STATION_A", [2020], "standard")
+    fetch_precip_for_years("dummy", "GHCND:STATION_A", [2020], "standard")
+    assert requests_mock.call_count == 2
+    assert not list(tmp_path.glob("*.json"))
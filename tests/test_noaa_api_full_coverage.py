@@ -4,9 +4,18 @@ import pandas as pd
 
 from noaa_api import has_full_prcp_coverage, find_nearby_station
 
+import noaa_api
+
 TOKEN = "fake-token"
 
 
+@pytest.fixture(autouse=True)
+def _clear_coverage_cache():
+    # Coverage probes are memoized; isolate tests from each other's mocks.
+    noaa_api._coverage_probe.cache_clear()
+    yield
+
+
 @pytest.fixture
 def station_id():
     return "GHCND:FAKESTATION"
@@ -48,6 +57,12 @@ def test_has_full_prcp_coverage_false(requests_mock, station_id):
     assert has_full_prcp_coverage(TOKEN, station_id, year, units="standard") is False
 
 
+def _for_station(sid: str):
+    """Matcher so each /data mock answers only its own station, regardless
+    of the order the (now concurrent) coverage probes arrive in."""
+    return lambda req: req.qs.get("stationid", [""])[0].lower() == sid.lower()
+
+
 def test_find_nearby_station_returns_first_with_full_coverage(requests_mock):
     year = 2025
     # Mock stations list
@@ -62,13 +77,16 @@ def test_find_nearby_station_returns_first_with_full_coverage(requests_mock):
         json=stations_json,
     )
 
-    # First station: missing data
+    # First station: missing data; second: full coverage
     requests_mock.get(
         "https://www.ncdc.noaa.gov/cdo-web/api/v2/data",
-        [
-            {"json": make_results_for_year(year, 100)},  # station 1
-            {"json": make_results_for_year(year, (date.today() - date(year, 1, 1)).days + 1)},  # station 2
-        ],
+        json=make_results_for_year(year, 100),
+        additional_matcher=_for_station("STATION1"),
+    )
+    requests_mock.get(
+        "https://www.ncdc.noaa.gov/cdo-web/api/v2/data",
+        json=make_results_for_year(year, (date.today() - date(year, 1, 1)).days + 1),
+        additional_matcher=_for_station("STATION2"),
     )
 
     result = find_nearby_station(TOKEN, 43.05, -89.5, year)
@@ -92,10 +110,13 @@ def test_find_nearby_station_none_if_no_full_coverage(requests_mock):
     # Both stations: missing data
     requests_mock.get(
         "https://www.ncdc.noaa.gov/cdo-web/api/v2/data",
-        [
-            {"json": make_results_for_year(year, 50)},  # station 1
-            {"json": make_results_for_year(year, 100)}, # station 2
-        ],
+        json=make_results_for_year(year, 50),
+        additional_matcher=_for_station("STATION1"),
+    )
+    requests_mock.get(
+        "https://www.ncdc.noaa.gov/cdo-web/api/v2/data",
+        json=make_results_for_year(year, 100),
+        additional_matcher=_for_station("STATION2"),
     )
 
     result = find_nearby_station(TOKEN, 43.05, -89.5, year)
@@ -0,0 +1,25 @@
+import pandas as pd
+from datetime import date
+
+from rainfall import prepare_cumulative_iter, prepare_cumulative_matrix
+
+
+def test_prepare_cumulative_iter_streams_one_tuple_per_year():
+    f1 = pd.DataFrame({"year": [2024], "doy": [1], "prcp": [1.0]})
+    f2 = pd.DataFrame({"year": [2024, 2025], "doy": [2, 1], "prcp": [2.0, 0.5]})
+
+    got = list(prepare_cumulative_iter([f1, f2], end_date=date(2024, 1, 2)))
+    assert [y for y, _, _ in got] == [2024, 2024, 2025]
+
+    # Each yielded row matches the corresponding matrix-kernel row
+    for frame, rows in ((f1, got[:1]), (f2, got[1:])):
+        years, doys, cum = prepare_cumulative_matrix(frame, end_date=date(2024, 1, 2))
+        for (y, d, row), year, mat_row in zip(rows, years, cum):
+            assert y == year
+            assert d.tolist() == doys.tolist()
+            assert row.tolist() == mat_row.tolist()
+
+
+def test_prepare_cumulative_iter_empty_frames_yield_nothing():
+    empty = pd.DataFrame(columns=["year", "doy", "prcp"])
+    assert list(prepare_cumulative_iter([empty, empty], end_date=date(2025, 1, 3))) == []
@@ -0,0 +1,29 @@
+import pandas as pd
+from datetime import date
+
+from rainfall import prepare_cumulative, prepare_cumulative_matrix
+
+
+def test_prepare_cumulative_matrix_matches_tall_output():
+    raw = pd.DataFrame({
+        "year": [2024, 2024, 2025],
+        "doy":  [1,    3,    2   ],
+        "prcp": [1.0,  2.0,  0.5 ],
+    })
+    years, doys, cum = prepare_cumulative_matrix(raw, end_date=date(2024, 1, 3))
+    tall = prepare_cumulative(raw, end_date=date(2024, 1, 3))
+
+    assert years.tolist() == [2024, 2025]
+    assert doys.tolist() == [1, 2, 3]
+    assert cum.shape == (2, 3)
+    # Row-major ravel of the matrix is exactly the tall frame's cum column
+    assert cum.ravel().tolist() == tall["cum"].tolist()
+
+
+def test_prepare_cumulative_matrix_empty_window_returns_empty_arrays():
+    years, doys, cum = prepare_cumulative_matrix(
+        pd.DataFrame(columns=["year", "doy", "prcp"]), end_date=date(2025, 1, 3)
+    )
+    assert years.size == 0
+    assert doys.size == 0
+    assert cum.shape == (0, 0)
@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+from datetime import date
+
+pytest.importorskip("polars")
+
+from rainfall import prepare_cumulative, prepare_cumulative_rain_days
+
+
+def _raw():
+    return pd.DataFrame({
+        "year": [2024, 2024, 2025],
+        "doy":  [1,    3,    2   ],
+        "prcp": [1.0,  2.0,  0.5 ],
+    })
+
+
+def test_polars_engine_matches_numpy_cumulative():
+    a = prepare_cumulative(_raw(), end_date=date(2024, 1, 3))
+    b = prepare_cumulative(_raw(), end_date=date(2024, 1, 3), engine="polars")
+    assert b["year"].tolist() == a["year"].tolist()
+    assert b["doy"].tolist() == a["doy"].tolist()
+    assert b["prcp"].tolist() == a["prcp"].tolist()
+    assert b["cum"].tolist() == a["cum"].tolist()
+
+
+def test_polars_engine_matches_numpy_rain_days():
+    a = prepare_cumulative_rain_days(_raw(), end_date=date(2024, 1, 3), threshold=0.6)
+    b = prepare_cumulative_rain_days(_raw(), end_date=date(2024, 1, 3), threshold=0.6, engine="polars")
+    assert b["year"].tolist() == a["year"].tolist()
+    assert b["rain_day"].tolist() == a["rain_day"].tolist()
+    assert b["cum_rain_days"].tolist() == a["cum_rain_days"].tolist()
+
+
+def test_polars_engine_empty_input_typed_empty():
+    out = prepare_cumulative(
+        pd.DataFrame(columns=["year", "doy", "prcp"]), end_date=date(2025, 1, 3), engine="polars"
+    )
+    assert list(out.columns) == ["year", "doy", "prcp", "cum"]
+    assert out.empty
+
+
+def test_unknown_engine_raises():
+    with pytest.raises(ValueError):
+        prepare_cumulative(_raw(), engine="dask")